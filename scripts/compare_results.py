@@ -1,27 +1,56 @@
 #!/usr/bin/env python3
 
 import csv
+import numpy as np
 import pandas as pd
 from pathlib import Path
 
+# Display names for Gurobi status codes
+GUROBI_STATUS_DESC = {
+    2: "Optimal", 9: "Time Limit", 3: "Infeasible", 5: "Unbounded", "ERROR": "Error"
+}
+
+def read_results_file(csv_file, usecols, dtype):
+    """
+    Read a results file, preferring the Parquet copy next to the CSV.
+
+    The Parquet copy is written only at the end of a run, while the CSV is
+    written as results arrive, so it is used only if it is at least as new
+    as the CSV. Otherwise an interrupted run would be compared using the
+    previous run's results.
+    """
+    csv_path = Path(csv_file)
+    parquet_file = csv_path.with_suffix('.parquet')
+    if parquet_file.exists() and (
+        not csv_path.exists() or parquet_file.stat().st_mtime >= csv_path.stat().st_mtime
+    ):
+        return pd.read_parquet(parquet_file, columns=usecols).astype(dtype)
+    return pd.read_csv(csv_file, usecols=usecols, dtype=dtype)
+
 def load_results():
-    """Load both cuOpt and Gurobi results from CSV files."""
+    """Load both cuOpt and Gurobi results from Parquet or CSV files."""
     cuopt_file = "/cuopt_results.csv"
     gurobi_file = "/gurobi_results.csv"
 
+    # Only parse the columns used in the comparison, with fixed dtypes.
+    # model_name and status repeat across joins and filters, so store them
+    # as categoricals.
+    usecols = ['model_name', 'solve_time', 'status', 'objective', 'error']
+    dtype = {'model_name': 'category', 'status': 'category', 'error': 'string'}
+
     # Load cuOpt results
-    cuopt_df = pd.read_csv(cuopt_file)
+    cuopt_df = read_results_file(cuopt_file, usecols, dtype)
     cuopt_df['solver'] = 'cuOpt'
 
     # Load Gurobi results
-    gurobi_df = pd.read_csv(gurobi_file)
+    gurobi_df = read_results_file(gurobi_file, usecols, dtype)
     gurobi_df['solver'] = 'Gurobi'
 
     return cuopt_df, gurobi_df
 
 def analyze_comparison():
     """Compare cuOpt and Gurobi results and identify specific issues."""
-    cuopt_df, gurobi_df = pd.read_csv("/cuopt_results.csv"), pd.read_csv("/gurobi_results.csv")
+    cuopt_df, gurobi_df = load_results()
 
     print("=" * 80)
     print("CPU vs GPU LP Benchmark Comparison")
@@ -37,8 +66,9 @@ def analyze_comparison():
 
     # cuOpt status analysis - convert to numeric first
     cuopt_df['status_num'] = pd.to_numeric(cuopt_df['status'], errors='coerce')
+    cuopt_df['is_error'] = cuopt_df['status'].str.contains('ERROR', regex=False, na=False)
     cuopt_optimal = (cuopt_df['status_num'] == 2).sum()
-    cuopt_errors = (cuopt_df['status'].str.contains('ERROR')).sum()
+    cuopt_errors = cuopt_df['is_error'].sum()
     cuopt_other = len(cuopt_df) - cuopt_optimal - cuopt_errors
 
     print(f"  cuOpt:")
@@ -48,9 +78,10 @@ def analyze_comparison():
 
     # Gurobi status analysis - convert to numeric first
     gurobi_df['status_num'] = pd.to_numeric(gurobi_df['status'], errors='coerce')
+    gurobi_df['is_error'] = gurobi_df['status'].str.contains('ERROR', regex=False, na=False)
     gurobi_optimal = (gurobi_df['status_num'] == 2).sum()
     gurobi_time_limit = (gurobi_df['status_num'] == 9).sum()
-    gurobi_errors = (gurobi_df['status'].str.contains('ERROR')).sum()
+    gurobi_errors = gurobi_df['is_error'].sum()
     gurobi_other = len(gurobi_df) - gurobi_optimal - gurobi_time_limit - gurobi_errors
 
     print(f"  Gurobi:")
@@ -59,30 +90,46 @@ def analyze_comparison():
     print(f"    Errors: {gurobi_errors} ({gurobi_errors/len(gurobi_df)*100:.1f}%)")
     print(f"    Other: {gurobi_other} ({gurobi_other/len(gurobi_df)*100:.1f}%)")
 
-    # Performance comparison for common problems
-    common_models = set(cuopt_df['model_name']) & set(gurobi_df['model_name'])
-    print(f"\n🔄 Performance Comparison (Common Problems: {len(common_models)}):")
+    # Index both result sets by model name once for constant-time lookups
+    cuopt_by = cuopt_df.set_index('model_name', drop=False)
+    gurobi_by = gurobi_df.set_index('model_name', drop=False)
+    cuopt_names = set(cuopt_df['model_name'])
+    gurobi_names = set(gurobi_df['model_name'])
 
-    # Merge dataframes for comparison
+    # Merge dataframes for comparison; the inner join is the set of common problems
+    # Columns are prefixed per solver so merged_df already has the output layout
+    merge_cols = ['model_name', 'solve_time', 'status', 'status_num', 'objective', 'error']
     merged_df = pd.merge(
-        cuopt_df[['model_name', 'solve_time', 'status', 'objective']],
-        gurobi_df[['model_name', 'solve_time', 'status', 'objective']],
+        cuopt_df[merge_cols].rename(columns=lambda c: c if c == 'model_name' else f'cuopt_{c}'),
+        gurobi_df[merge_cols].rename(columns=lambda c: c if c == 'model_name' else f'gurobi_{c}'),
         on='model_name',
-        suffixes=('_cuopt', '_gurobi')
+        how='inner'
+    )
+
+    # Performance comparison for common problems
+    print(f"\n🔄 Performance Comparison (Common Problems: {len(merged_df)}):")
+
+    # Speedup and winner for every common problem, computed column-wise.
+    # A problem with a missing solve time (e.g. a solver error) has winner 'N/A'.
+    t_c = merged_df['cuopt_solve_time']
+    t_g = merged_df['gurobi_solve_time']
+    merged_df['speedup'] = (t_g / t_c).where(t_c > 0)
+    merged_df['winner'] = np.select(
+        [t_c < t_g, t_g < t_c, t_c.notna() & t_g.notna()],
+        ['cuOpt', 'Gurobi', 'Tie'],
+        default='N/A'
     )
 
     # Filter to problems where both solved optimally
     both_optimal = merged_df[
-        (merged_df['status_cuopt'] == 2) & (merged_df['status_gurobi'] == 2)
+        (merged_df['cuopt_status_num'] == 2) & (merged_df['gurobi_status_num'] == 2)
     ]
 
     if len(both_optimal) > 0:
-        # Calculate speedup
-        both_optimal['speedup'] = both_optimal['solve_time_gurobi'] / both_optimal['solve_time_cuopt']
-
+        # Speedup comes from merged_df; it is NaN where cuOpt reports a 0s time
         print(f"  Both solved optimally: {len(both_optimal)} problems")
-        print(f"  Average cuOpt time: {both_optimal['solve_time_cuopt'].mean():.3f}s")
-        print(f"  Average Gurobi time: {both_optimal['solve_time_gurobi'].mean():.3f}s")
+        print(f"  Average cuOpt time: {both_optimal['cuopt_solve_time'].mean():.3f}s")
+        print(f"  Average Gurobi time: {both_optimal['gurobi_solve_time'].mean():.3f}s")
         print(f"  Average speedup (Gurobi/cuOpt): {both_optimal['speedup'].mean():.2f}x")
         print(f"  cuOpt faster in: {(both_optimal['speedup'] > 1).sum()} problems")
         print(f"  Gurobi faster in: {(both_optimal['speedup'] < 1).sum()} problems")
@@ -91,83 +138,57 @@ def analyze_comparison():
     print(f"\n🚨 Specific Issues Analysis:")
 
     # 1. Gurobi time limit issues (status = 9)
-    gurobi_time_limit_problems = gurobi_df[gurobi_df['status'] == 9]
+    gurobi_time_limit_problems = gurobi_df[gurobi_df['status_num'] == 9]
     if len(gurobi_time_limit_problems) > 0:
         print(f"\n  ⏰ Gurobi Time Limit Issues ({len(gurobi_time_limit_problems)} problems):")
         for _, row in gurobi_time_limit_problems.iterrows():
-            cuopt_status = cuopt_df[cuopt_df['model_name'] == row['model_name']]['status'].iloc[0] if row['model_name'] in cuopt_df['model_name'].values else "N/A"
-            cuopt_time = cuopt_df[cuopt_df['model_name'] == row['model_name']]['solve_time'].iloc[0] if row['model_name'] in cuopt_df['model_name'].values else "N/A"
+            cuopt_status = cuopt_by.at[row['model_name'], 'status'] if row['model_name'] in cuopt_names else "N/A"
+            cuopt_time = cuopt_by.at[row['model_name'], 'solve_time'] if row['model_name'] in cuopt_names else "N/A"
             print(f"    {row['model_name']}: Gurobi hit time limit, cuOpt status={cuopt_status}, time={cuopt_time}s")
 
     # 2. cuOpt error issues (marked as OOM)
-    cuopt_error_problems = cuopt_df[cuopt_df['status'] == 'ERROR']
+    cuopt_error_problems = cuopt_df[cuopt_df['is_error']]
     if len(cuopt_error_problems) > 0:
         print(f"\n  💾 cuOpt Error Issues ({len(cuopt_error_problems)} problems):")
         for _, row in cuopt_error_problems.iterrows():
-            gurobi_status = gurobi_df[gurobi_df['model_name'] == row['model_name']]['status'].iloc[0] if row['model_name'] in gurobi_df['model_name'].values else "N/A"
-            gurobi_time = gurobi_df[gurobi_df['model_name'] == row['model_name']]['solve_time'].iloc[0] if row['model_name'] in gurobi_df['model_name'].values else "N/A"
+            gurobi_status = gurobi_by.at[row['model_name'], 'status'] if row['model_name'] in gurobi_names else "N/A"
+            gurobi_time = gurobi_by.at[row['model_name'], 'solve_time'] if row['model_name'] in gurobi_names else "N/A"
             print(f"    {row['model_name']}: cuOpt error ({row['error']}), Gurobi status={gurobi_status}, time={gurobi_time}s")
 
     # 3. Problems where one solver succeeded and the other failed
     print(f"\n  🔄 Solver Success Comparison:")
 
     # cuOpt succeeded, Gurobi failed/time limited
-    cuopt_success_gurobi_fail = []
-    for model in common_models:
-        cuopt_row = cuopt_df[cuopt_df['model_name'] == model].iloc[0]
-        gurobi_row = gurobi_df[gurobi_df['model_name'] == model].iloc[0]
-
-        if cuopt_row['status_num'] == 2 and gurobi_row['status_num'] != 2:
-            cuopt_success_gurobi_fail.append((model, cuopt_row, gurobi_row))
+    cuopt_success_gurobi_fail = merged_df[
+        (merged_df['cuopt_status_num'] == 2) & (merged_df['gurobi_status_num'] != 2)
+    ]
 
-    if cuopt_success_gurobi_fail:
+    if len(cuopt_success_gurobi_fail) > 0:
         print(f"    cuOpt succeeded, Gurobi failed/time limited ({len(cuopt_success_gurobi_fail)} problems):")
-        for model, cuopt_row, gurobi_row in cuopt_success_gurobi_fail:
-            gurobi_status_desc = {
-                2: "Optimal", 9: "Time Limit", 3: "Infeasible", 5: "Unbounded", "ERROR": "Error"
-            }.get(gurobi_row['status_num'], f"Status_{gurobi_row['status_num']}")
-            print(f"      {model}: cuOpt {cuopt_row['solve_time']:.3f}s, Gurobi {gurobi_status_desc}")
+        for _, row in cuopt_success_gurobi_fail.iterrows():
+            gurobi_status_desc = GUROBI_STATUS_DESC.get(row['gurobi_status_num'], f"Status_{row['gurobi_status_num']}")
+            print(f"      {row['model_name']}: cuOpt {row['cuopt_solve_time']:.3f}s, Gurobi {gurobi_status_desc}")
 
     # Gurobi succeeded, cuOpt failed
-    gurobi_success_cuopt_fail = []
-    for model in common_models:
-        cuopt_row = cuopt_df[cuopt_df['model_name'] == model].iloc[0]
-        gurobi_row = gurobi_df[gurobi_df['model_name'] == model].iloc[0]
-
-        if gurobi_row['status_num'] == 2 and cuopt_row['status_num'] != 2:
-            gurobi_success_cuopt_fail.append((model, cuopt_row, gurobi_row))
+    gurobi_success_cuopt_fail = merged_df[
+        (merged_df['gurobi_status_num'] == 2) & (merged_df['cuopt_status_num'] != 2)
+    ]
 
-    if gurobi_success_cuopt_fail:
+    if len(gurobi_success_cuopt_fail) > 0:
         print(f"    Gurobi succeeded, cuOpt failed ({len(gurobi_success_cuopt_fail)} problems):")
-        for model, cuopt_row, gurobi_row in gurobi_success_cuopt_fail:
-            print(f"      {model}: Gurobi {gurobi_row['solve_time']:.3f}s, cuOpt error ({cuopt_row['error']})")
+        for _, row in gurobi_success_cuopt_fail.iterrows():
+            print(f"      {row['model_name']}: Gurobi {row['gurobi_solve_time']:.3f}s, cuOpt error ({row['cuopt_error']})")
 
     # Create detailed comparison CSV
     print(f"\n💾 Creating detailed comparison file...")
 
-    # Prepare comparison data
-    comparison_data = []
-    for model in common_models:
-        cuopt_row = cuopt_df[cuopt_df['model_name'] == model].iloc[0]
-        gurobi_row = gurobi_df[gurobi_df['model_name'] == model].iloc[0]
-
-        comparison_data.append({
-            'model_name': model,
-            'cuopt_solve_time': cuopt_row['solve_time'] if cuopt_row['solve_time'] is not None else None,
-            'cuopt_status': cuopt_row['status'],
-            'cuopt_objective': cuopt_row['objective'],
-            'cuopt_error': cuopt_row['error'],
-            'gurobi_solve_time': gurobi_row['solve_time'] if gurobi_row['solve_time'] is not None else None,
-            'gurobi_status': gurobi_row['status'],
-            'gurobi_objective': gurobi_row['objective'],
-            'gurobi_error': gurobi_row['error'],
-            'speedup': gurobi_row['solve_time'] / cuopt_row['solve_time'] if (cuopt_row['solve_time'] is not None and gurobi_row['solve_time'] is not None and cuopt_row['solve_time'] > 0) else None,
-            'winner': 'cuOpt' if (cuopt_row['solve_time'] is not None and gurobi_row['solve_time'] is not None and cuopt_row['solve_time'] < gurobi_row['solve_time']) else 'Gurobi' if (cuopt_row['solve_time'] is not None and gurobi_row['solve_time'] is not None and gurobi_row['solve_time'] < cuopt_row['solve_time']) else 'Tie' if (cuopt_row['solve_time'] is not None and gurobi_row['solve_time'] is not None) else 'N/A'
-        })
-
     # Save comparison CSV
-    comparison_df = pd.DataFrame(comparison_data)
-    comparison_df.to_csv("/home/dubo/Projects/cpu-gpu-lp-benchmark/comparison_results.csv", index=False)
+    merged_df[[
+        'model_name',
+        'cuopt_solve_time', 'cuopt_status', 'cuopt_objective', 'cuopt_error',
+        'gurobi_solve_time', 'gurobi_status', 'gurobi_objective', 'gurobi_error',
+        'speedup', 'winner'
+    ]].to_csv("/home/dubo/Projects/cpu-gpu-lp-benchmark/comparison_results.csv", index=False)
 
     print(f"  Detailed comparison saved to: comparison_results.csv")
 
@@ -2,17 +2,60 @@
 
 import os
 import csv
+from collections import deque
+from contextlib import closing
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from concurrent.futures.process import BrokenProcessPool
+from functools import partial
+from multiprocessing.util import Finalize
 from pathlib import Path
 import gurobipy as gp
 from gurobipy import GRB
+from results_io import save_parquet
 
-def solve_mps_with_gurobi(mps_file_path, time_limit=600):
+# Display names for Gurobi status codes and the error marker used in results
+STATUS_DESC = {
+    GRB.OPTIMAL: "Optimal",
+    GRB.TIME_LIMIT: "Time Limit",
+    GRB.INFEASIBLE: "Infeasible",
+    GRB.UNBOUNDED: "Unbounded",
+    "ERROR": "Error"
+}
+
+# Gurobi environment shared by all problems solved in a worker process
+_worker_env = None
+
+def get_worker_env():
+    """
+    Return this process's shared Gurobi environment, starting it on first use.
+
+    The environment is disposed when the process exits.
+    """
+    global _worker_env
+    if _worker_env is None:
+        env = gp.Env(empty=True)
+        try:
+            env.setParam('OutputFlag', 0)
+            env.start()
+        except Exception:
+            # Free the failed env so every retry does not leak one
+            env.dispose()
+            raise
+        # The global keeps env alive, so the finalizer needs no weakref to it
+        Finalize(None, env.dispose, exitpriority=10)
+        _worker_env = env
+    return _worker_env
+
+def solve_mps_with_gurobi(mps_file_path, time_limit=600, threads=0, shared_env=False):
     """
     Solve a single MPS file using Gurobi for LP relaxation.
 
     Args:
         mps_file_path (str): Path to the MPS file
         time_limit (int): Time limit in seconds
+        threads (int): Gurobi Threads parameter; 0 lets Gurobi use all cores
+        shared_env (bool): Reuse this process's Gurobi environment instead of
+            creating a default one for every model
 
     Returns:
         dict: Results containing model_name, solve_time, status, objective
@@ -27,13 +70,15 @@ def solve_mps_with_gurobi(mps_file_path, time_limit=600):
     }
 
     try:
-        # Read the model
-        model = gp.read(mps_file_path)
+        # Read the model; environment startup failures (e.g. no license)
+        # are reported as an error for this problem
+        env = get_worker_env() if shared_env else None
+        model = gp.read(mps_file_path, env=env)
 
         # Configure for LP relaxation - convert integer variables to continuous
-        for v in model.getVars():
-            if v.vType != GRB.CONTINUOUS:
-                v.vType = GRB.CONTINUOUS
+        # in a single bulk attribute call
+        variables = model.getVars()
+        model.setAttr(GRB.Attr.VType, variables, [GRB.CONTINUOUS] * len(variables))
         model.update()
 
         # Set solver parameters to match cuOpt benchmark
@@ -41,6 +86,7 @@ def solve_mps_with_gurobi(mps_file_path, time_limit=600):
         model.setParam('Presolve', 1)  # Enable presolve like cuOpt
         model.setParam('OutputFlag', 0)  # Suppress verbose output
         model.setParam('Method', -1)  # Automatic method selection
+        model.setParam('Threads', threads)  # 0 = automatic (all cores)
 
         # Optimize the model
         model.optimize()
@@ -62,13 +108,97 @@ def solve_mps_with_gurobi(mps_file_path, time_limit=600):
 
     return result
 
+def crash_result(mps_file):
+    """Result record for a problem whose worker process died while solving it."""
+    return {
+        'model_name': Path(mps_file).stem,
+        'solve_time': None,
+        'status': "ERROR",
+        'objective': None,
+        'error': "Worker process died while solving (e.g. killed for running out of memory)"
+    }
+
+def solve_all(mps_files, solve, num_workers):
+    """
+    Solve MPS files in worker processes, yielding results as they complete.
+
+    At most num_workers problems are in flight, so a worker that dies (e.g.
+    killed for running out of memory) only affects the problems that were
+    running. A problem that was running alone is recorded as the crash; problems
+    that were running together are retried one at a time to find the one that
+    crashed. Problems that never started are resubmitted to a new executor.
+    Close the generator (e.g. with contextlib.closing) so that stopping early
+    cancels the problems that have not started.
+
+    Args:
+        mps_files (list): Paths of the MPS files to solve
+        solve (callable): Picklable function taking an MPS path and returning a result dict
+        num_workers (int): Number of worker processes
+
+    Yields:
+        dict: Result record for each problem, in completion order
+    """
+    pending = deque(mps_files)
+    suspects = deque()
+
+    while pending or suspects:
+        executor = ProcessPoolExecutor(max_workers=num_workers)
+        running = {}
+        broken = False
+
+        try:
+            while not broken and (pending or suspects or running):
+                # Suspects of a previous crash run alone; otherwise keep every worker busy
+                if suspects:
+                    if not running:
+                        mps_file = suspects.popleft()
+                        running[executor.submit(solve, str(mps_file))] = mps_file
+                else:
+                    while pending and len(running) < num_workers:
+                        mps_file = pending.popleft()
+                        running[executor.submit(solve, str(mps_file))] = mps_file
+
+                done, _ = wait(running, return_when=FIRST_COMPLETED)
+                if any(isinstance(future.exception(), BrokenProcessPool) for future in done):
+                    # The pool is gone; every in-flight problem either finished or failed with it
+                    broken = True
+                    done, _ = wait(running)
+
+                crashed = []
+                for future in done:
+                    mps_file = running.pop(future)
+                    if isinstance(future.exception(), BrokenProcessPool):
+                        crashed.append(mps_file)
+                    else:
+                        yield future.result()
+
+                if len(crashed) == 1:
+                    yield crash_result(crashed[0])
+                else:
+                    suspects.extend(crashed)
+        except BaseException:
+            # Interrupted (including the caller closing this generator): drop
+            # queued problems instead of waiting for them to be solved
+            executor.shutdown(wait=False, cancel_futures=True)
+            raise
+        executor.shutdown()
+
 def main():
     """Main benchmark function."""
     # Configuration
     mps_data_dir = "/benchmarks/miplib_data"
     results_dir = "/gurobi_results"
     csv_file = "/gurobi_results.csv"
+    # All per-problem logs go to this one file instead of one <model>.log each
+    log_file = os.path.join(results_dir, "results.log")
     time_limit = 600  # 10 minutes like cuOpt benchmark
+    # Timings in README.md come from solving one problem at a time with all
+    # threads. Concurrent solves compete for cache and memory bandwidth and
+    # inflate Runtime, so only raise num_workers for quick runs, not for
+    # timings that will be compared with cuOpt. Each worker holds its own
+    # Gurobi license token; keep num_workers * threads within the core count.
+    num_workers = 1  # Problems solved concurrently
+    threads = 0  # Gurobi Threads per solve; 0 = automatic (all cores)
 
     # Create results directory if it doesn't exist
     os.makedirs(results_dir, exist_ok=True)
@@ -80,8 +210,11 @@ def main():
         print(f"No MPS files found in {mps_data_dir}")
         return
 
+    num_workers = min(num_workers, len(mps_files))
+
     print(f"Found {len(mps_files)} MPS files to process")
     print(f"Time limit: {time_limit} seconds per problem")
+    print(f"Worker processes: {num_workers}, Gurobi threads per solve: {threads or 'automatic'}")
     print(f"Results will be saved to: {csv_file}")
     print("-" * 60)
 
@@ -89,54 +222,55 @@ def main():
     csv_headers = ['model_name', 'solve_time', 'status', 'objective', 'error']
     results = []
 
-    # Process each MPS file
-    for i, mps_file in enumerate(mps_files, 1):
-        print(f"[{i}/{len(mps_files)}] Processing: {mps_file.name}")
+    # Process MPS files in worker processes, handling results as they complete
+    # Only the parent writes, so all per-problem logs share one file
+    # Each worker starts one Gurobi environment on its first problem and
+    # disposes it when the executor shuts the worker down
+    solve = partial(solve_mps_with_gurobi, time_limit=time_limit, threads=threads, shared_env=True)
+    with closing(solve_all(mps_files, solve, num_workers)) as solved, \
+            open(log_file, 'w') as log, \
+            open(csv_file, 'w', newline='') as csv_out:
+        # Write each CSV row as soon as it is available so a crash keeps prior results
+        writer = csv.DictWriter(csv_out, fieldnames=csv_headers)
+        writer.writeheader()
 
-        # Solve the model
-        result = solve_mps_with_gurobi(str(mps_file), time_limit)
-        results.append(result)
+        for i, result in enumerate(solved, 1):
+            print(f"[{i}/{len(mps_files)}] Finished: {result['model_name']}")
+            results.append(result)
+            writer.writerow(result)
+            csv_out.flush()
 
-        # Display progress
-        status_desc = {
-            GRB.OPTIMAL: "Optimal",
-            GRB.TIME_LIMIT: "Time Limit",
-            GRB.INFEASIBLE: "Infeasible",
-            GRB.UNBOUNDED: "Unbounded",
-            GRB.Error: "Error"
-        }.get(result['status'], f"Status_{result['status']}")
+            # Display progress
+            status_desc = STATUS_DESC.get(result['status'], f"Status_{result['status']}")
 
-        time_str = f"{result['solve_time']:.3f}s" if result['solve_time'] is not None else "N/A"
-        obj_str = f"{result['objective']:.6e}" if isinstance(result['objective'], (int, float)) else str(result['objective'])
+            time_str = f"{result['solve_time']:.3f}s" if result['solve_time'] is not None else "N/A"
+            obj_str = f"{result['objective']:.6e}" if isinstance(result['objective'], (int, float)) else str(result['objective'])
 
-        print(f"  Status: {status_desc}, Time: {time_str}, Objective: {obj_str}")
+            print(f"  Status: {status_desc}, Time: {time_str}, Objective: {obj_str}")
 
-        if result['error']:
-            print(f"  Error: {result['error']}")
+            if result['error']:
+                print(f"  Error: {result['error']}")
 
-        # Save individual log file
-        log_content = f"""Model: {result['model_name']}
+            # Append individual log record
+            log_content = f"""Model: {result['model_name']}
 Status: {status_desc} ({result['status']})
 Solve Time: {time_str}
 Objective: {obj_str}
 """
-        if result['error']:
-            log_content += f"Error: {result['error']}\n"
+            if result['error']:
+                log_content += f"Error: {result['error']}\n"
 
-        log_file = os.path.join(results_dir, f"{result['model_name']}.log")
-        with open(log_file, 'w') as f:
-            f.write(log_content)
+            log.write(log_content + "\n")
+            log.flush()
 
-    # Save summary CSV
-    with open(csv_file, 'w', newline='') as f:
-        writer = csv.DictWriter(f, fieldnames=csv_headers)
-        writer.writeheader()
-        writer.writerows(results)
+    parquet_file = save_parquet(results, csv_file)
 
     print("-" * 60)
     print(f"Benchmark completed!")
     print(f"Results saved to: {csv_file}")
-    print(f"Individual logs saved to: {results_dir}")
+    if parquet_file:
+        print(f"Parquet copy saved to: {parquet_file}")
+    print(f"Per-problem logs saved to: {log_file}")
 
     # Summary statistics
     successful_solves = sum(1 for r in results if r['status'] == GRB.OPTIMAL)
@@ -150,7 +284,12 @@ Objective: {obj_str}
     print(f"  Errors: {errors}")
 
     if successful_solves > 0:
-        avg_time = sum(r['solve_time'] for r in results if r['solve_time'] is not None) / len([r for r in results if r['solve_time'] is not None])
+        total_time, timed = 0.0, 0
+        for r in results:
+            if r['solve_time'] is not None:
+                total_time += r['solve_time']
+                timed += 1
+        avg_time = total_time / timed
         print(f"  Average solve time: {avg_time:.3f}s")
 
 if __name__ == "__main__":
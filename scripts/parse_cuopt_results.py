@@ -3,7 +3,81 @@
 import os
 import re
 import csv
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
+from results_io import save_parquet
+
+# Pattern: Concurrent time: 0.479s, total time 0.522s
+_CONCURRENT_RE = re.compile(rb'Concurrent time:\s*([\d,\.]+s),\s*total time\s*([\d,\.]+s)')
+
+# Pattern: Status: Optimal   Objective: 2.87906569e+03  Iterations: 277
+_STATUS_RE = re.compile(rb'Status:\s*(\w+)\s+Objective:\s*(\S+)\s+Iterations:\s*\d+')
+
+# cuOpt status names mapped to the matching Gurobi status codes
+STATUS_MAP = {
+    'Optimal': 2,  # GRB.OPTIMAL
+    'Time': 9,     # GRB.TIME_LIMIT (if it says "Time Limit")
+    'Infeasible': 3,  # GRB.INFEASIBLE
+    'Unbounded': 5,   # GRB.UNBOUNDED
+    'Unknown': 11     # Other status
+}
+
+# Display names for numeric status codes
+STATUS_DESC = {
+    2: "Optimal",
+    9: "Time Limit",
+    3: "Infeasible",
+    5: "Unbounded",
+    11: "Unknown"
+}
+
+def _line_fields(content, marker):
+    """Return the whitespace-split fields of the line starting at marker, or None."""
+    start = content.find(marker)
+    if start < 0:
+        return None
+    end = content.find(b'\n', start)
+    return content[start:end if end >= 0 else len(content)].split()
+
+def _is_time_field(field):
+    """Check that field looks like a cuOpt time value, e.g. b'1,234.5s'."""
+    return field.endswith(b's') and field[:-1].translate(None, b',.').isdigit()
+
+def _scan_total_time(content):
+    """
+    Find the total time field of the concurrent line.
+
+    Scans with bytes.find and falls back to the regex if the line does not
+    have the expected shape.
+    """
+    parts = _line_fields(content, b'Concurrent time:')
+    # [b'Concurrent', b'time:', b'0.479s,', b'total', b'time', b'0.522s']
+    if (parts is not None and len(parts) >= 6
+            and parts[2].endswith(b',') and _is_time_field(parts[2][:-1])
+            and parts[3] == b'total' and parts[4] == b'time'
+            and _is_time_field(parts[5])):
+        return parts[5]
+
+    match = _CONCURRENT_RE.search(content)
+    return match.group(2) if match else None
+
+def _scan_status(content):
+    """
+    Find the status and objective fields of the status line.
+
+    Scans with bytes.find and falls back to the regex if the line does not
+    have the expected shape.
+    """
+    parts = _line_fields(content, b'Status:')
+    # [b'Status:', b'Optimal', b'Objective:', b'2.87906569e+03', b'Iterations:', b'277']
+    if (parts is not None and len(parts) >= 6
+            and parts[0] == b'Status:' and parts[1].replace(b'_', b'').isalnum()
+            and parts[2] == b'Objective:'
+            and parts[4] == b'Iterations:' and parts[5].isdigit()):
+        return parts[1], parts[3]
+
+    match = _STATUS_RE.search(content)
+    return match.groups() if match else None
 
 def parse_cuopt_log(log_file_path):
     """
@@ -25,45 +99,34 @@ def parse_cuopt_log(log_file_path):
     }
 
     try:
-        with open(log_file_path, 'r') as f:
+        # Read raw bytes; only the captured fields are decoded
+        with open(log_file_path, 'rb') as f:
             content = f.read()
 
         # First, find concurrent line which contains the actual solve time
-        # Pattern: Concurrent time: 0.479s, total time 0.522s
-        concurrent_pattern = r'Concurrent time:\s*([\d,\.]+s),\s*total time\s*([\d,\.]+s)'
-        concurrent_match = re.search(concurrent_pattern, content)
+        total_time = _scan_total_time(content)
 
         # Then find status line for status and objective
-        # Pattern: Status: Optimal   Objective: 2.87906569e+03  Iterations: 277
-        status_pattern = r'Status:\s*(\w+)\s+Objective:\s*(\S+)\s+Iterations:\s*\d+'
-        status_match = re.search(status_pattern, content)
+        status_fields = _scan_status(content)
 
-        if concurrent_match and status_match:
+        if total_time is not None and status_fields is not None:
             # Extract solve time from concurrent line (total time)
-            total_time_str = concurrent_match.group(2)
+            total_time_str = total_time.decode('ascii')
             if total_time_str.endswith('s'):
                 total_time_str = total_time_str[:-1]
             total_time_clean = total_time_str.replace(',', '')
             result['solve_time'] = float(total_time_clean)
 
             # Extract status and objective from status line
-            status = status_match.group(1)
-            objective = status_match.group(2)
-
-            # Convert status to numeric for consistency with Gurobi
-            status_map = {
-                'Optimal': 2,  # GRB.OPTIMAL
-                'Time': 9,     # GRB.TIME_LIMIT (if it says "Time Limit")
-                'Infeasible': 3,  # GRB.INFEASIBLE
-                'Unbounded': 5,   # GRB.UNBOUNDED
-                'Unknown': 11     # Other status
-            }
+            status = status_fields[0].decode('ascii')
+            objective = status_fields[1].decode('ascii')
 
             # Handle "Time Limit" vs just "Time"
             if 'Limit' in status:
                 status = 'Time Limit'
 
-            result['status'] = status_map.get(status, 11)
+            # Convert status to numeric for consistency with Gurobi
+            result['status'] = STATUS_MAP.get(status, 11)
             result['objective'] = objective
         else:
             # If no required lines found, it might be an error or incomplete log
@@ -83,7 +146,7 @@ def main():
     csv_file = "/cuopt_results.csv"
 
     # Find all log files
-    log_files = list(Path(cuopt_results_dir).glob("*.log"))
+    log_files = sorted(Path(cuopt_results_dir).glob("*.log"))
 
     if not log_files:
         print(f"No log files found in {cuopt_results_dir}")
@@ -97,31 +160,25 @@ def main():
     csv_headers = ['model_name', 'solve_time', 'status', 'objective', 'error']
     results = []
 
-    # Process each log file
-    for i, log_file in enumerate(log_files, 1):
-        print(f"[{i}/{len(log_files)}] Parsing: {log_file.name}")
+    # Parse log files in parallel; map keeps results in log file order
+    with ProcessPoolExecutor() as executor:
+        parsed = executor.map(parse_cuopt_log, map(str, log_files), chunksize=16)
+        for i, (log_file, result) in enumerate(zip(log_files, parsed), 1):
+            print(f"[{i}/{len(log_files)}] Parsing: {log_file.name}")
+            results.append(result)
 
-        result = parse_cuopt_log(str(log_file))
-        results.append(result)
+            # Display progress
+            if result['status'] == 'ERROR':
+                print(f"  Status: ERROR, Time: N/A, Objective: N/A")
+                if result['error']:
+                    print(f"  Error: {result['error']}")
+            else:
+                status_desc = STATUS_DESC.get(result['status'], f"Status_{result['status']}")
 
-        # Display progress
-        if result['status'] == 'ERROR':
-            print(f"  Status: ERROR, Time: N/A, Objective: N/A")
-            if result['error']:
-                print(f"  Error: {result['error']}")
-        else:
-            status_desc = {
-                2: "Optimal",
-                9: "Time Limit",
-                3: "Infeasible",
-                5: "Unbounded",
-                11: "Unknown"
-            }.get(result['status'], f"Status_{result['status']}")
-
-            time_str = f"{result['solve_time']:.3f}s" if result['solve_time'] is not None else "N/A"
-            obj_str = str(result['objective']) if result['objective'] is not None else "N/A"
+                time_str = f"{result['solve_time']:.3f}s" if result['solve_time'] is not None else "N/A"
+                obj_str = str(result['objective']) if result['objective'] is not None else "N/A"
 
-            print(f"  Status: {status_desc}, Time: {time_str}, Objective: {obj_str}")
+                print(f"  Status: {status_desc}, Time: {time_str}, Objective: {obj_str}")
 
     # Save CSV
     with open(csv_file, 'w', newline='') as f:
@@ -129,9 +186,13 @@ def main():
         writer.writeheader()
         writer.writerows(results)
 
+    parquet_file = save_parquet(results, csv_file)
+
     print("-" * 60)
     print(f"Parsing completed!")
     print(f"Results saved to: {csv_file}")
+    if parquet_file:
+        print(f"Parquet copy saved to: {parquet_file}")
 
     # Summary statistics
     optimal_solves = sum(1 for r in results if r['status'] == 2)
@@ -0,0 +1,33 @@
+#!/usr/bin/env python3
+
+from pathlib import Path
+
+def save_parquet(results, csv_file):
+    """
+    Save results as Parquet next to the CSV for faster reloads.
+
+    pandas and a Parquet engine are optional; without them only the CSV is kept.
+
+    Args:
+        results (list): Result dicts as written to the CSV
+        csv_file (str): Path of the CSV file
+
+    Returns:
+        str: Path to the Parquet file, or None if pandas or a Parquet engine is missing
+    """
+    parquet_file = str(Path(csv_file).with_suffix('.parquet'))
+
+    try:
+        import pandas as pd
+
+        # Normalize mixed-type columns so they match what read_csv infers
+        df = pd.DataFrame(results)
+        df['status'] = df['status'].astype(str)
+        df['objective'] = pd.to_numeric(df['objective'], errors='coerce')
+
+        df.to_parquet(parquet_file, index=False)
+    except ImportError as e:
+        print(f"Skipping Parquet output: {e}")
+        return None
+
+    return parquet_file
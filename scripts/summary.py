@@ -1,6 +1,57 @@
 #!/usr/bin/env python3
 
-import pandas as pd
+import csv
+import math
+import statistics
+from collections import Counter
+
+def read_rows(csv_file):
+    """Read a results CSV into a list of dicts keyed by column name."""
+    with open(csv_file, newline='') as f:
+        return list(csv.DictReader(f))
+
+def is_number(value):
+    """Check whether a CSV field parses as a float."""
+    try:
+        float(value)
+        return True
+    except (TypeError, ValueError):
+        return False
+
+def to_float(value):
+    """Convert a CSV field to float, returning NaN for empty or non-numeric values."""
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return float('nan')
+
+def print_markdown_table(rows, columns):
+    """
+    Print rows as a Markdown table, right-aligning numeric columns.
+
+    The table renders like DataFrame.to_markdown but is not byte-identical:
+    cells are padded to the column width without tabulate's decimal alignment.
+    """
+    numeric = {col: all(r[col] == '' or is_number(r[col]) for r in rows) for col in columns}
+    cells = [
+        [f"{to_float(r[col]):g}" if numeric[col] else r[col] for col in columns]
+        for r in rows
+    ]
+    widths = [max([len(col)] + [len(row[i]) for row in cells]) for i, col in enumerate(columns)]
+
+    def fmt(values):
+        return "| " + " | ".join(
+            v.rjust(w) if numeric[col] else v.ljust(w)
+            for v, w, col in zip(values, widths, columns)
+        ) + " |"
+
+    print(fmt(columns))
+    print("|" + "|".join(
+        ":" + "-" * (w + 1) if not numeric[col] else "-" * (w + 1) + ":"
+        for w, col in zip(widths, columns)
+    ) + "|")
+    for row in cells:
+        print(fmt(row))
 
 def main():
     """Generate a final summary of the benchmark comparison."""
@@ -8,35 +59,35 @@ def main():
     print("=" * 60)
 
     # Load results
-    cuopt_df = pd.read_csv("../cuopt_results.csv")
-    gurobi_df = pd.read_csv("../gurobi_results.csv")
-    comparison_df = pd.read_csv("../comparison_results.csv")
+    cuopt_rows = read_rows("../cuopt_results.csv")
+    gurobi_rows = read_rows("../gurobi_results.csv")
+    comparison_rows = read_rows("../comparison_results.csv")
 
     print(f"\n📊 Dataset Overview:")
     print(f"  Total MIPLIB problems: 240")
-    print(f"  cuOpt results: {len(cuopt_df)} problems")
-    print(f"  Gurobi results: {len(gurobi_df)} problems")
+    print(f"  cuOpt results: {len(cuopt_rows)} problems")
+    print(f"  Gurobi results: {len(gurobi_rows)} problems")
 
     # Success rates
-    cuopt_success_rate = (cuopt_df['status'] == 2).sum() / len(cuopt_df) * 100
-    gurobi_success_rate = (gurobi_df['status'] == 2).sum() / len(gurobi_df) * 100
+    cuopt_success_rate = sum(1 for r in cuopt_rows if r['status'] == '2') / len(cuopt_rows) * 100
+    gurobi_success_rate = sum(1 for r in gurobi_rows if r['status'] == '2') / len(gurobi_rows) * 100
 
     print(f"\n✅ Success Rates:")
     print(f"  cuOpt (GPU): {cuopt_success_rate:.1f}% success rate")
     print(f"  Gurobi (CPU): {gurobi_success_rate:.1f}% success rate")
 
     # Performance comparison for common solved problems
-    both_solved = comparison_df[
-        (comparison_df['winner'] == 'cuOpt') | (comparison_df['winner'] == 'Gurobi')
-    ]
+    both_solved = [r for r in comparison_rows if r['winner'] in ('cuOpt', 'Gurobi')]
 
     if len(both_solved) > 0:
-        cuopt_faster = (both_solved['winner'] == 'cuOpt').sum()
-        gurobi_faster = (both_solved['winner'] == 'Gurobi').sum()
-        ties = (both_solved['winner'] == 'Tie').sum()
+        winners = Counter(r['winner'] for r in both_solved)
+        cuopt_faster = winners['cuOpt']
+        gurobi_faster = winners['Gurobi']
+        ties = winners['Tie']
 
-        avg_speedup = both_solved['speedup'].mean()
-        median_speedup = both_solved['speedup'].median()
+        speedups = [s for s in (to_float(r['speedup']) for r in both_solved) if not math.isnan(s)]
+        avg_speedup = statistics.mean(speedups) if speedups else float('nan')
+        median_speedup = statistics.median(speedups) if speedups else float('nan')
 
         print(f"\n⚡ Performance Comparison ({len(both_solved)} common solved problems):")
         print(f"  cuOpt faster: {cuopt_faster} problems ({cuopt_faster/len(both_solved)*100:.1f}%)")
@@ -49,49 +100,48 @@ def main():
     print(f"\n💡 Key Insights:")
 
     # Overall winner
-    if 'winner' in comparison_df.columns:
-        winner_counts = comparison_df['winner'].value_counts()
+    if comparison_rows and 'winner' in comparison_rows[0]:
+        winner_counts = Counter(r['winner'] for r in comparison_rows if r['winner'] not in ('', 'N/A'))
         if len(winner_counts) > 0:
-            overall_winner = winner_counts.index[0] if winner_counts.iloc[0] > 0 else None
-            if overall_winner:
+            overall_winner, overall_wins = winner_counts.most_common(1)[0]
+            if overall_wins > 0:
                 print(f"  🏆 Overall winner: {overall_winner}")
-                print(f"     Won {winner_counts[overall_winner]} out of {len(winner_counts)} compared problems")
+                print(f"     Won {overall_wins} out of {len(winner_counts)} compared problems")
 
     # Specific issues
     print(f"\n⚠️  Specific Issues to Investigate:")
 
     # cuOpt memory issues
-    cuopt_memory_issues = cuopt_df[cuopt_df['status'].str.contains('ERROR', na=False)]
+    cuopt_memory_issues = [r for r in cuopt_rows if 'ERROR' in r['status']]
     if len(cuopt_memory_issues) > 0:
         print(f"  💾 cuOpt memory/out-of-memory issues: {len(cuopt_memory_issues)} problems")
-        for _, row in cuopt_memory_issues.iterrows():
+        for row in cuopt_memory_issues:
             print(f"     - {row['model_name']}: {row['error']}")
 
     # Gurobi time limit issues (if any)
-    gurobi_time_issues = gurobi_df[gurobi_df['status'] == 9]
+    gurobi_time_issues = [r for r in gurobi_rows if r['status'] == '9']
     if len(gurobi_time_issues) > 0:
         print(f"  ⏰ Gurobi time limit issues: {len(gurobi_time_issues)} Problems")
-        for _, row in gurobi_time_issues.iterrows():
+        for row in gurobi_time_issues:
             print(f"     - {row['model_name']}: hit 600s limit")
 
     # Performance extremes
-    if 'speedup' in comparison_df.columns:
-        extreme_cases = comparison_df.nlargest(5, 'speedup')
+    if comparison_rows and 'speedup' in comparison_rows[0]:
+        with_speedup = [r for r in comparison_rows if not math.isnan(to_float(r['speedup']))]
+        extreme_cases = sorted(with_speedup, key=lambda r: to_float(r['speedup']), reverse=True)[:5]
         print(f"\n📈 Most Extreme Performance Differences:")
-        for _, row in extreme_cases.iterrows():
-            faster = "Gurobi" if row['speedup'] < 1 else "cuOpt"
-            print(f"  {row['model_name']}: {row['speedup']:.1f}x faster ({faster})")
+        for row in extreme_cases:
+            speedup = to_float(row['speedup'])
+            faster = "Gurobi" if speedup < 1 else "cuOpt"
+            print(f"  {row['model_name']}: {speedup:.1f}x faster ({faster})")
 
     print(f"\n📁 Files Generated:")
     print(f"  • cuopt_results.csv - Parsed cuOpt (GPU) results")
     print(f"  • gurobi_results.csv - Gurobi (CPU) benchmark results")
     print(f"  • comparison_results.csv - Detailed performance comparison")
 
-    # Load CSV
-    df = pd.read_csv("../comparison_results.csv")
-    df = df [["model_name", "cuopt_solve_time", "cuopt_objective", "gurobi_solve_time", "gurobi_objective", "winner", "speedup"]]
-    # Convert to Markdown
-    print(df.to_markdown(index=False))
+    # Convert to Markdown (equivalent to to_markdown, not character-for-character)
+    print_markdown_table(comparison_rows, ["model_name", "cuopt_solve_time", "cuopt_objective", "gurobi_solve_time", "gurobi_objective", "winner", "speedup"])
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()